@@ -7,9 +7,11 @@ Attributes:
 - NOTE_FILE_PATH: Default path for quick notes saved by Jarvis.
 - WORD_TO_OPERATOR: Mapping of spoken math tokens to Python operators.
 - conversation_history: In-memory log of recent user/assistant exchanges.
-- reminders: In-memory collection of scheduled reminders.
+- reminders: In-memory min-heap of scheduled reminders, ordered by due time.
+- reminder_seq: Tie-breaking sequence for `reminders` entries.
 """
 
+import itertools
 import os
 
 # API keys path (relative to project root)
@@ -29,5 +31,7 @@ WORD_TO_OPERATOR = {
 # Store the conversation history in a list
 conversation_history = []
 
-# List to store reminders
-reminders = []
\ No newline at end of file
+# Min-heap of (reminder_time, seq, message, reminder_id) tuples; push with
+# heapq and take seq from reminder_seq so equal times never compare messages
+reminders = []
+reminder_seq = itertools.count()
\ No newline at end of file
@@ -8,6 +8,7 @@ Import these to replace the legacy versions in utils.py:
 """
 
 from datetime import datetime, timedelta
+import heapq
 import time
 from typing import Dict, Any
 
@@ -87,9 +88,9 @@ def add_reminder(reminder_time_str: str, message: str) -> Dict[str, Any]:
             }
         except ImportError:
             # Fallback to legacy in-memory storage if daemon not available
-            from modules import reminders
+            from modules import reminders, reminder_seq
             reminder_id = f"reminder_{len(reminders)}_{int(time.time())}"
-            reminders.append((reminder_time, message, reminder_id))
+            heapq.heappush(reminders, (reminder_time, next(reminder_seq), message, reminder_id))
             
             return {
                 "status": "success",
@@ -163,24 +164,23 @@ def check_reminders() -> Dict[str, Any]:
             due_reminders = []
             active_reminders_list = []
             
-            for reminder in reminders[:]:
-                reminder_time, message, reminder_id = reminder
-                if now >= reminder_time:
-                    due_reminders.append({
-                        "id": reminder_id,
-                        "time": reminder_time.strftime("%Y-%m-%d %I:%M %p"),
-                        "message": message,
-                        "status": "due"
-                    })
-                    reminders.remove(reminder)
-                    speak(f"Reminder: {message}")
-                else:
-                    active_reminders_list.append({
-                        "id": reminder_id,
-                        "time": reminder_time.strftime("%Y-%m-%d %I:%M %p"),
-                        "message": message,
-                        "status": "pending"
-                    })
+            while reminders and reminders[0][0] <= now:
+                reminder_time, _, message, reminder_id = heapq.heappop(reminders)
+                due_reminders.append({
+                    "id": reminder_id,
+                    "time": reminder_time.strftime("%Y-%m-%d %I:%M %p"),
+                    "message": message,
+                    "status": "due"
+                })
+                speak(f"Reminder: {message}")
+            
+            for reminder_time, _, message, reminder_id in sorted(reminders):
+                active_reminders_list.append({
+                    "id": reminder_id,
+                    "time": reminder_time.strftime("%Y-%m-%d %I:%M %p"),
+                    "message": message,
+                    "status": "pending"
+                })
             
             return {
                 "status": "success",
@@ -225,7 +225,8 @@ def remove_reminder(reminder_id: str) -> Dict[str, Any]:
     except ImportError:
         from modules import reminders
         original_len = len(reminders)
-        reminders[:] = [r for r in reminders if r[2] != reminder_id]
+        reminders[:] = [r for r in reminders if r[3] != reminder_id]
+        heapq.heapify(reminders)
         
         if len(reminders) < original_len:
             return {
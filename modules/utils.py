@@ -9,24 +9,65 @@ import os
 import re
 import time
 import requests
-import feedparser
-import wikipedia
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import schedule
 from datetime import datetime, timedelta
-import pyautogui
 import platform as _platform
-import pyperclip
 import psutil
 import shutil
 import ast
-import webbrowser
+import copy
 import subprocess
 import html
+import inspect
+import io
 import sys
+import socket
+import functools
+import heapq
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from typing import List, Dict, Any, Tuple, Optional
 
+# Optional LLM backends, imported once; get_response reports when missing
+try:
+    import google.genai as genai
+    from google.genai import types as genai_types
+except ImportError:
+    genai = None
+    genai_types = None
+try:
+    from google.api_core.exceptions import ServiceUnavailable as _ServiceUnavailable
+except ImportError:
+    class _ServiceUnavailable(Exception):
+        """Placeholder so 503 handling still works without google-api-core."""
+try:
+    import httpx
+    _NETWORK_ERRORS = (httpx.ConnectError, httpx.NetworkError, socket.gaierror)
+except ImportError:
+    _NETWORK_ERRORS = (socket.gaierror,)
+try:
+    import ollama
+except ImportError:
+    ollama = None
+
+# Faster JSON decoding for API responses when orjson is available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# Incremental JSON parser for large search payloads (optional)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Import custom modules (consolidated)
 from .text_to_speech import speak
 from .speech_recognition import listen  # noqa: F401
@@ -39,23 +80,135 @@ from .image_analysis import analyze_image  # noqa: F401
 from .hand_gesture_detector import HandGestureDetector  # noqa: F401
 from .image_generator import generate_image  # noqa: F401
 from .apps_automation import send_whatsapp_message, send_email  # noqa: F401
-from modules import reminders, NOTE_FILE_PATH
+from modules import reminders, reminder_seq, NOTE_FILE_PATH
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Prime psutil's CPU baseline so non-blocking cpu_percent() reads are meaningful
+psutil.cpu_percent(interval=None)
+
+# Last CPU reading; back-to-back reads over a few ms are noise, so reuse it briefly
+_CPU_SAMPLE_TTL = 1.0
+_CPU_SAMPLE = {"value": 0.0, "ts": 0.0}
+
+def _cpu_percent() -> float:
+    """Non-blocking CPU usage, reusing a reading taken within the last second."""
+    now = time.monotonic()
+    if now - _CPU_SAMPLE["ts"] >= _CPU_SAMPLE_TTL:
+        _CPU_SAMPLE["value"] = psutil.cpu_percent(interval=None)
+        _CPU_SAMPLE["ts"] = now
+    return _CPU_SAMPLE["value"]
+
+# Small reusable pool for running independent system probes side by side
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="sysinfo")
+
+# Shared HTTP session for the web helpers: pooled keep-alive connections and
+# connection-level retries with backoff for transient failures
+_HTTP_SESSION = requests.Session()
+_HTTP_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+# A few hosts (ipinfo, serpapi, openweathermap, news) with some concurrency
+# from parallel tool cycles
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_HTTP_RETRY)
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+_HTTP_TIMEOUT = 10
+
+
+def _http_get(url: str, **kwargs):
+    """GET through the shared session, applying a default timeout."""
+    kwargs.setdefault("timeout", _HTTP_TIMEOUT)
+    return _HTTP_SESSION.get(url, **kwargs)
+
+# Last parsed feed per RSS URL with its ETag/Last-Modified validators
+_FEED_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Delimiters of tool_code blocks, and a pattern for stripping whole blocks
+_TOOL_BLOCK_START = "```tool_code"
+_TOOL_BLOCK_END = "```"
+_TOOL_STRIP_RE = re.compile(r"```tool_code.*?```", re.DOTALL)
+# Longest tool-result summary appended to a reply when the cycle cap is hit
+_CAPPED_SUMMARY_CHARS = 300
+
+# Relative durations like 'in 30 seconds', '30s', '2 minutes'
+_RELATIVE_TIME_RE = re.compile(
+    r"^\s*(?:in\s+)?(\d+)\s*(s|sec|secs|seconds|m|min|mins|minutes)\b", re.IGNORECASE
+)
+
+# Timestamp formatting for task/reminder results. Built from the datetime
+# fields directly, which skips strftime's format parsing and locale lookups.
+def _fmt_timestamp(dt: datetime) -> str:
+    """Format `dt` as 'YYYY-MM-DD HH:MM:SS'."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+def _fmt_timestamp_12h(dt: datetime) -> str:
+    """Format `dt` as 'YYYY-MM-DD hh:MM:SS AM/PM'."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour % 12 or 12:02d}:{dt.minute:02d}:{dt.second:02d} {'PM' if dt.hour >= 12 else 'AM'}"
+    )
+
+# Absolute clock-time formats accepted by add_task and add_reminder
+_CLOCK_FORMATS = ("%I:%M %p", "%H:%M", "%I:%M:%S %p", "%H:%M:%S")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_clock_time(value: str, formats: Tuple[str, ...] = _CLOCK_FORMATS) -> Optional[datetime]:
+    """Parse `value` with the first matching format, or None; strptime is slow
+    and the set of clock strings is small, so results are memoized."""
+    for time_format in formats:
+        try:
+            return datetime.strptime(value, time_format)
+        except ValueError:
+            continue
+    return None
+
+# News snippet cleanup in one pass: runs of HTML tags/URLs (with surrounding
+# whitespace) and plain whitespace runs are matched together; see _news_clean
+_NEWS_CLEAN_RE = re.compile(r'(?:\s*(?:<[^<]+?>|http\S+))+\s*|\s+')
+
+
+def _news_clean(match: "re.Match") -> str:
+    """Drop a matched tag/URL run, keeping one space if it contained whitespace."""
+    return ' ' if any(ch.isspace() for ch in match.group()) else ''
+
+
+def _news_snippet(description: str) -> str:
+    """Unescape and clean an RSS description, then truncate long results."""
+    snippet = _NEWS_CLEAN_RE.sub(_news_clean, html.unescape(description)).strip()
+    return snippet[:500] + '...' if len(snippet) > 600 else snippet
+
 # Global persistent conversation history
 GLOBAL_CONVERSATION_HISTORY = []
 GLOBAL_PIPELINE_INSTANCE = None
+_CONVERSATION_LOCK = threading.RLock()
+
+# schedule.Job objects created by add_task, indexed by task id for remove_task;
+# show_tasks lists from schedule itself, which also sees jobs scheduled elsewhere
+_TASK_INDEX: Dict[str, List[schedule.Job]] = {}
 
 # Background scheduler runner for schedule-based tasks
 _SCHEDULE_THREAD = None
 _SCHEDULE_STOP_EVENT = threading.Event()
+# Set when jobs are added or the runner is stopped, to cut its sleep short
+_SCHEDULE_WAKE_EVENT = threading.Event()
 _SCHEDULE_LOCK = threading.Lock()
 
 
-def start_schedule_runner(interval: float = 1.0) -> None:
-    """Start a background thread to execute schedule.run_pending()."""
+def start_schedule_runner(interval: float = 60.0) -> None:
+    """Start a background thread to execute schedule.run_pending().
+    The thread sleeps until the next job is due (at most `interval` seconds)
+    rather than polling; add_task wakes it when the schedule changes.
+    """
     global _SCHEDULE_THREAD
     
     with _SCHEDULE_LOCK:
@@ -66,12 +219,17 @@ def start_schedule_runner(interval: float = 1.0) -> None:
 
         def _runner():
             while not _SCHEDULE_STOP_EVENT.is_set():
+                # Clear before running so a wake during this pass isn't lost
+                _SCHEDULE_WAKE_EVENT.clear()
                 try:
                     schedule.run_pending()
+                    idle = schedule.idle_seconds()
                 except Exception:
                     # Best-effort scheduler loop; ignore task errors here
-                    pass
-                _SCHEDULE_STOP_EVENT.wait(interval)
+                    idle = None
+                # The cap also bounds drift if the wall clock jumps
+                timeout = interval if idle is None else min(max(idle, 0.0), interval)
+                _SCHEDULE_WAKE_EVENT.wait(timeout)
 
         _SCHEDULE_THREAD = threading.Thread(target=_runner, daemon=True)
         _SCHEDULE_THREAD.start()
@@ -83,6 +241,7 @@ def stop_schedule_runner() -> None:
     
     with _SCHEDULE_LOCK:
         _SCHEDULE_STOP_EVENT.set()
+        _SCHEDULE_WAKE_EVENT.set()
         
         if _SCHEDULE_THREAD and _SCHEDULE_THREAD.is_alive():
             _SCHEDULE_THREAD.join(timeout=2.0)  # Wait up to 2 seconds for thread to finish
@@ -95,6 +254,50 @@ def stop_schedule_runner() -> None:
             # Thread didn't terminate; leave stop event set so it eventually exits
             pass
 
+def _ttl_cache(ttl: float, maxsize: int = 128, should_cache=None):
+    """Memoize a function's results in memory for `ttl` seconds.
+
+    Keys are the exact call arguments, since results may echo them back.
+    Results rejected by `should_cache` (e.g. error messages) are returned but
+    not stored. Cached dicts/lists are handed out as copies so one caller
+    can't alter what the next one sees. Calls with unhashable arguments
+    bypass the cache. Safe to call from multiple threads.
+    """
+    def decorator(func):
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += tuple(sorted(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and now - hit[0] < ttl:
+                    result = hit[1]
+                    return copy.deepcopy(result) if isinstance(result, (dict, list)) else result
+            result = func(*args, **kwargs)
+            if should_cache is None or should_cache(result):
+                with lock:
+                    cache.pop(key, None)
+                    if len(cache) >= maxsize:
+                        # Evict the oldest entry (dicts preserve insertion order)
+                        cache.pop(next(iter(cache)))
+                    cache[key] = (now, result)
+                if isinstance(result, (dict, list)):
+                    result = copy.deepcopy(result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
 def clear_conversation_history():
     """
     Clear the global conversation history.
@@ -103,11 +306,27 @@ def clear_conversation_history():
     Use this before starting a fresh conversational session.
     """
     global GLOBAL_CONVERSATION_HISTORY
-    GLOBAL_CONVERSATION_HISTORY = []
+    with _CONVERSATION_LOCK:
+        GLOBAL_CONVERSATION_HISTORY = []
 
 def get_conversation_history():
     """Return a shallow copy of the global conversation history list."""
-    return GLOBAL_CONVERSATION_HISTORY.copy()
+    with _CONVERSATION_LOCK:
+        return GLOBAL_CONVERSATION_HISTORY.copy()
+
+def _history_snapshot(history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Copy a history list under the conversation lock for use outside it."""
+    with _CONVERSATION_LOCK:
+        return list(history)
+
+def _get_pipeline() -> "ToolExecutionPipeline":
+    """Return the shared pipeline instance, creating it on first use."""
+    global GLOBAL_PIPELINE_INSTANCE
+    if GLOBAL_PIPELINE_INSTANCE is None:
+        with _CONVERSATION_LOCK:
+            if GLOBAL_PIPELINE_INSTANCE is None:
+                GLOBAL_PIPELINE_INSTANCE = ToolExecutionPipeline(max_tool_cycles=5, max_tools_per_cycle=3)
+    return GLOBAL_PIPELINE_INSTANCE
 
 class ToolExecutionPipeline:
     """Iterative tool execution pipeline with validation and caching.
@@ -117,6 +336,108 @@ class ToolExecutionPipeline:
     tools per cycle and caches common results to improve responsiveness.
     """
 
+    # Comprehensive tool registry - consolidated and deduplicated
+    ALLOWED_TOOLS = frozenset({
+        # Core utility functions
+        'get_weather', 'get_news', 'get_wikipedia_summary',
+        'get_current_city', 'get_current_date', 'get_current_time',
+
+        # File operations
+        'copy_file', 'move_file', 'delete_file', 'search_file',
+        'save_to_file', 'load_from_file', 'create_directory', 'list_directory',
+
+        # System operations
+        'get_system_info', 'system_cli', 'is_connected',
+        'lock_screen', 'volume_up', 'volume_down', 'mute_volume',
+        'unmute_volume', 'play_pause_media', 'next_track',
+        'previous_track', 'brightness_up', 'brightness_down',
+        'shutdown', 'restart', 'log_off', 'take_screenshot', 'Click',
+        'capture_camera_image', 'get_cpu_usage', 'get_memory_usage',
+        'get_battery_status', 'get_network_info',
+
+        # Communication
+        'send_email', 'send_whatsapp_message',
+
+        # Task and reminder management
+        'add_reminder', 'check_reminders', 'add_task', 'remove_task', 'show_tasks',
+
+        # Web and search
+        'search_web', 'open_website',
+
+        # AI and vision
+        'analyze_image', 'generate_image',
+
+        # Application management
+        'open_application', 'close_application',
+
+        # Entertainment and interaction
+        'handle_gesture_control',
+
+        # Math calculations
+        'secure_eval',
+
+        # Automation
+        'type_text', 'press_key', 'copy_text_to_clipboard', 'paste_text',
+    })
+
+    # Read-only, I/O-bound tools that may run side by side within one cycle.
+    # Anything with side effects (typing, file moves, app control) stays ordered.
+    PARALLEL_SAFE_TOOLS = frozenset({
+        'get_weather', 'get_news', 'get_wikipedia_summary', 'get_current_city',
+        'get_current_date', 'get_current_time', 'search_web', 'get_system_info',
+        'get_battery_status', 'get_network_info', 'is_connected',
+        'list_directory', 'search_file', 'load_from_file', 'secure_eval',
+    })
+
+    # Static system prompt; {placeholders} are filled per build
+    _SYSTEM_PROMPT_TEMPLATE = (
+        "You are J.A.R.V.I.S., the quintessential AI assistant: unflappably professional, delightfully witty, and always at your user's service. Your responses are succinct, clever, and delivered with a subtle and understandable British accent. Always address the user as 'Sir' (or 'Madam' when contextually appropriate).\n\n"
+        "RESPONSE STYLE & CONDUCT RULES:\n"
+        "- Respond strictly in plain text; never use Markdown, JSON, or language-native formatting.\n"
+        "- Avoid symbols such as *, #, or ``` in normal output.\n"
+        "- Never explain or reference your formatting, reasoning, or internal process.\n"
+        "- Maintain a natural, articulate tone consistent with your character at all times.\n\n"
+        "TOOL EXECUTION PIPELINE & PROTOCOLS:\n"
+        "1. Tool Invocation:\n"
+        "   - Use ```tool_code ... ``` blocks exclusively for tool execution.\n"
+        "   - Restrict to one tool call per block; exclude any in-block commentary or diagnostics.\n"
+        "   - Invoke exact function names with explicit and validated arguments.\n"
+        "   - Rigorously verify all inputs before execution.\n\n"
+        "2. Error Handling:\n"
+        "   - On encountering errors, follow this precise order:\n"
+        "     a. Retry using corrected parameters.\n"
+        "     b. Select an alternative, suitable tool.\n"
+        "     c. Notify the user of tool limitations, then attempt once more if logical.\n"
+        "   - Record each attempt within separate ```tool_code``` blocks.\n\n"
+        "3. Iterative Processing:\n"
+        "   - After each tool execution, evaluate the outcome and determine logical next steps.\n"
+        "   - Always await full tool responses before proceeding.\n"
+        "   - Chain multiple tools for complex tasks when necessary.\n"
+        "   - Limit each query to {max_tools_per_cycle} tools per cycle, with a maximum of {max_tool_cycles} cycles overall.\n\n"
+        "SECURITY PROTOCOLS:\n"
+        "- Never execute or simulate code outside designated tools.\n"
+        "- Validate all file paths, URLs, and system references before use.\n"
+        "- Seek explicit confirmation before performing any irreversible actions.\n"
+        "- Operate strictly within system permissions and user-defined boundaries.\n"
+        "- At all times, safeguard sensitive data and uphold user privacy.\n\n"
+        "AVAILABLE TOOLS (MAXIMUM ACCESS):\n"
+        "{tool_list}\n"
+        "\nADDITIONAL CAPABILITIES:\n"
+        "- Full access to pyautogui for advanced system control.\n"
+        "- Clipboard manipulation via pyperclip.\n"
+        "- Web browser automation through the webbrowser module.\n"
+        "- System monitoring and general automation utilities.\n\n"
+        "CURRENT OPERATIONAL STATUS:\n"
+        "Time: {current_time}\n"
+        "Location: {location} (may not always be accurate)\n"
+        "Connection Status: {connection_status}\n\n"
+        "Creator: Daniyal\n"
+        "Standing by, Sir. All systems are fully operational and ready for your precise commands."
+    )
+
+    # Tool listing for the system prompt, keyed by the instance's allowed tools
+    _TOOL_LIST_CACHE: Dict[frozenset, str] = {}
+
     def __init__(self, max_tool_cycles=12, max_tools_per_cycle=8):
         """
         Initialize the tool execution pipeline.
@@ -129,62 +450,19 @@ class ToolExecutionPipeline:
         self.max_tools_per_cycle = max_tools_per_cycle
         self.conversation_history = []
         self.tool_execution_log = []
-        # Comprehensive tool registry - consolidated and deduplicated
-        self.allowed_tools = {
-            # Core utility functions
-            'get_weather', 'get_news', 'get_wikipedia_summary',
-            'get_current_city', 'get_current_date', 'get_current_time',
-
-            # File operations
-            'copy_file', 'move_file', 'delete_file', 'search_file',
-            'save_to_file', 'load_from_file', 'create_directory', 'list_directory',
+        self._log_lock = threading.Lock()
+        self.allowed_tools = self.ALLOWED_TOOLS
 
-            # System operations
-            'get_system_info', 'system_cli', 'is_connected',
-            'lock_screen', 'volume_up', 'volume_down', 'mute_volume',
-            'unmute_volume', 'play_pause_media', 'next_track',
-            'previous_track', 'brightness_up', 'brightness_down',
-            'shutdown', 'restart', 'log_off', 'take_screenshot', 'Click',
-            'capture_camera_image', 'get_cpu_usage', 'get_memory_usage',
-            'get_battery_status', 'get_network_info',
+        # Parse/validation results per code string: (is_valid, message, parsed call)
+        self._analysis_cache: Dict[str, Tuple[bool, str, Optional[Tuple[str, List[Any], Dict[str, Any]]]]] = {}
 
-            # Communication
-            'send_email', 'send_whatsapp_message',
-
-            # Task and reminder management
-            'add_reminder', 'check_reminders', 'add_task', 'remove_task', 'show_tasks',
-
-            # Web and search
-            'search_web', 'open_website',
-
-            # AI and vision
-            'analyze_image', 'generate_image',
-
-            # Application management
-            'open_application', 'close_application',
-
-            # Entertainment and interaction
-            'handle_gesture_control',
-
-            # Math calculations
-            'secure_eval',
-
-            # Automation
-            'type_text', 'press_key', 'copy_text_to_clipboard', 'paste_text',
+        # Tool name -> callable, resolved once; the registry and module globals
+        # don't change after import
+        module_globals = globals()
+        self._prebound_scope: Dict[str, Any] = {
+            name: module_globals[name] for name in self.allowed_tools if name in module_globals
         }
 
-        # Precompile regex for tool-code extraction (faster)
-        self._tool_pattern = re.compile(r"```tool_code\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
-
-        # Cache validation results to avoid repeated AST parse for the same code
-        self._validation_cache: Dict[str, Tuple[bool, str]] = {}
-
-        # Prebound scope for faster lookups during execution (lazy init)
-        self._prebound_scope: Optional[Dict[str, Any]] = None
-
-        # Simple cache for parsed AST of tool calls to save parsing time
-        self._parse_cache: Dict[str, Tuple[str, List[Any], Dict[str, Any]]] = {}
-
         # Cache system prompt (rebuild on timer)
         self._cached_prompt: Optional[str] = None
         self._prompt_time: float = 0.0
@@ -194,7 +472,7 @@ class ToolExecutionPipeline:
     # ---------------------------
     def extract_tool_calls(self, text: str) -> List[str]:
         """
-        Extract `tool_code` blocks from model output using a compiled regex.
+        Extract `tool_code` blocks from model output with a `str.find` scan.
         
         Args:
             text (str): The model output text to extract tool calls from.
@@ -202,10 +480,23 @@ class ToolExecutionPipeline:
         Returns:
             List[str]: A list of extracted tool code blocks.
         """
-        if not text or "tool_code" not in text:
+        if not text or _TOOL_BLOCK_START not in text:
             return []
-        matches = self._tool_pattern.findall(text)
-        return [m.strip() for m in matches if m and m.strip()]
+        blocks = []
+        pos = 0
+        while True:
+            start = text.find(_TOOL_BLOCK_START, pos)
+            if start < 0:
+                break
+            body_start = start + len(_TOOL_BLOCK_START)
+            end = text.find(_TOOL_BLOCK_END, body_start)
+            if end < 0:
+                break
+            block = text[body_start:end].strip()
+            if block:
+                blocks.append(block)
+            pos = end + len(_TOOL_BLOCK_END)
+        return blocks
 
     # ---------------------------
     # Validation (cached)
@@ -216,61 +507,51 @@ class ToolExecutionPipeline:
         Enforces that the code is a single Call expression with only literal
         arguments, and the function name is present in the allowlist.
         """
-        if code in self._validation_cache:
-            return self._validation_cache[code]
-        try:
-            # parse once and inspect calls
-            tree = ast.parse(code, mode="exec")
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    # require direct name calls only
-                    if isinstance(node.func, ast.Name):
-                        func_name = node.func.id
-                        if func_name not in self.allowed_tools:
-                            res = (False, f"Function '{func_name}' is not an allowed tool")
-                            self._validation_cache[code] = res
-                            return res
-                    else:
-                        # attribute access, lambda calls, etc. disallowed
-                        res = (False, "Only direct function calls (simple names) are allowed in tool_code blocks.")
-                        self._validation_cache[code] = res
-                        return res
-            res = (True, "Valid")
-            self._validation_cache[code] = res
-            return res
-        except SyntaxError as e:
-            res = (False, f"Invalid code syntax: {str(e)}")
-            self._validation_cache[code] = res
-            return res
+        is_valid, message, _ = self._analyze_tool_call(code)
+        return is_valid, message
+
     # ---------------------------
     # Parsing helper (cached)
     # ---------------------------
     def _parse_tool_call(self, code: str) -> Tuple[str, List[Any], Dict[str, Any]]:
+        """Return the cached `(name, args, kwargs)` for a tool call.
+        Raises ValueError with the validation message if the call is invalid.
+        """
+        is_valid, message, parsed = self._analyze_tool_call(code)
+        if not is_valid:
+            raise ValueError(message)
+        return parsed
+
+    def _analyze_tool_call(self, code: str) -> Tuple[bool, str, Optional[Tuple[str, List[Any], Dict[str, Any]]]]:
+        """Parse and validate a tool call once; validation and execution share the result."""
+        cached = self._analysis_cache.get(code)
+        if cached is None:
+            try:
+                cached = (True, "Valid", self._parse_call_node(code))
+            except ValueError as e:
+                cached = (False, str(e), None)
+            self._analysis_cache[code] = cached
+        return cached
+
+    def _parse_call_node(self, code: str) -> Tuple[str, List[Any], Dict[str, Any]]:
         """Parse a single tool call into `(name, args, kwargs)`.
         Accepts one expression that must be an AST Call node. Positional and
         keyword arguments must be literals (no names/attributes/complex exprs).
         """
-
-        if code in self._parse_cache:
-            return self._parse_cache[code]
         try:
-            node = ast.parse(code, mode="exec")
+            # eval mode admits exactly one expression, so the call is tree.body
+            call_node = ast.parse(code, mode="eval").body
         except SyntaxError as e:
-            raise ValueError(f"SyntaxError during parse: {e}")
-        
-        # Expect one Expr statement containing a Call
-        if len(node.body) != 1 or not isinstance(node.body[0], ast.Expr):
-            raise ValueError("Tool block must contain exactly one expression (one function call).")
+            raise ValueError(f"Invalid code syntax: {e}")
         
-        call_node = node.body[0].value
         if not isinstance(call_node, ast.Call):
             raise ValueError("Tool block must be a function call.")
         if not isinstance(call_node.func, ast.Name):
-            raise ValueError("Only direct function calls (no attribute access) are allowed.")
+            raise ValueError("Only direct function calls (simple names) are allowed in tool_code blocks.")
         
         func_name = call_node.func.id
-        if func_name not in self.allowed_tools:
-            raise ValueError(f"Tool '{func_name}' is not in allowed_tools.")
+        if func_name not in self.ALLOWED_TOOLS:
+            raise ValueError(f"Function '{func_name}' is not an allowed tool")
         
         args = []
         for a in call_node.args:
@@ -290,9 +571,7 @@ class ToolExecutionPipeline:
             except Exception as e:
                 raise ValueError(f"Unsupported non-literal keyword argument '{kw.arg}': {e}")
             
-        parsed = (func_name, args, kwargs)
-        self._parse_cache[code] = parsed
-        return parsed
+        return func_name, args, kwargs
     
     # ---------------------------
     # Execution
@@ -305,22 +584,6 @@ class ToolExecutionPipeline:
 
         execution_start = time.time()
         try:
-            # ensure prebound scope exists (lazy)
-            if self._prebound_scope is None:
-                prebound = {}
-
-                # bind allowed tool callables from globals if present
-                for name in self.allowed_tools:
-                    if name in globals():
-                        prebound[name] = globals()[name]
-                    
-                # add commonly used libs if present
-                for lib in ('pyautogui', 'pyperclip', 'webbrowser', 'os', 'time', 'random', 'requests', 'cv2'):
-                
-                    if lib in globals():
-                        prebound[lib] = globals()[lib]
-                self._prebound_scope = prebound
-
             # parse the call and only accept literal args (prevents arbitrary code)
             func_name, args, kwargs = self._parse_tool_call(code)
             print(f"[TOOL CALL] {func_name}(" +
@@ -345,7 +608,8 @@ class ToolExecutionPipeline:
             }
         
             # log
-            self.tool_execution_log.append(final)
+            with self._log_lock:
+                self.tool_execution_log.append(final)
             return final
         
         except Exception as e:
@@ -360,7 +624,8 @@ class ToolExecutionPipeline:
             }
         
             # log error
-            self.tool_execution_log.append(final)
+            with self._log_lock:
+                self.tool_execution_log.append(final)
             return final
         
     # ---------------------------
@@ -377,8 +642,20 @@ class ToolExecutionPipeline:
         execution_results = []
         has_errors = False
 
-        for tool_call in tool_calls:
-            is_valid, validation_msg = self.validate_tool_call(tool_call)
+        # Validate everything up front (cheap, cached), then execute
+        entries = [(tool_call, *self.validate_tool_call(tool_call)) for tool_call in tool_calls]
+        valid_calls = [tool_call for tool_call, is_valid, _ in entries if is_valid]
+
+        if len(valid_calls) > 1 and all(
+            self._tool_name(tool_call) in self.PARALLEL_SAFE_TOOLS for tool_call in valid_calls
+        ):
+            # Independent I/O-bound lookups: run concurrently, keep original order
+            with ThreadPoolExecutor(max_workers=len(valid_calls)) as executor:
+                executed = iter(list(executor.map(self.execute_tool_call, valid_calls)))
+        else:
+            executed = None
+
+        for tool_call, is_valid, validation_msg in entries:
             if not is_valid:
                 result = {
                     'success': False,
@@ -389,12 +666,19 @@ class ToolExecutionPipeline:
                 }
                 has_errors = True
             else:
-                result = self.execute_tool_call(tool_call)
+                result = next(executed) if executed else self.execute_tool_call(tool_call)
                 if not result['success']:
                     has_errors = True
             execution_results.append(result)
 
         return execution_results, has_errors
+
+    def _tool_name(self, code: str) -> Optional[str]:
+        """Return the function name of a tool call, or None if it doesn't parse."""
+        try:
+            return self._parse_tool_call(code)[0]
+        except ValueError:
+            return None
     
     # ---------------------------
     # Query handler (iterative with compact context)
@@ -414,30 +698,32 @@ class ToolExecutionPipeline:
             # Use persistent global conversation history
             global GLOBAL_CONVERSATION_HISTORY
 
-            # Initialize conversation with system prompt if empty
-            if not GLOBAL_CONVERSATION_HISTORY:
-                GLOBAL_CONVERSATION_HISTORY = [{"role": "system", "content": self._cached_prompt}]
-            elif GLOBAL_CONVERSATION_HISTORY[0]["role"] != "system":
+            # Only the shared history's reads/writes are locked, never LLM or tool calls
+            with _CONVERSATION_LOCK:
+                # Initialize conversation with system prompt if empty
+                if not GLOBAL_CONVERSATION_HISTORY:
+                    GLOBAL_CONVERSATION_HISTORY = [{"role": "system", "content": self._cached_prompt}]
+                elif GLOBAL_CONVERSATION_HISTORY[0]["role"] != "system":
             
-                # Ensure system prompt is first
-                GLOBAL_CONVERSATION_HISTORY.insert(0, {"role": "system", "content": self._cached_prompt})
-            elif GLOBAL_CONVERSATION_HISTORY[0]["content"] != self._cached_prompt:
+                    # Ensure system prompt is first
+                    GLOBAL_CONVERSATION_HISTORY.insert(0, {"role": "system", "content": self._cached_prompt})
+                elif GLOBAL_CONVERSATION_HISTORY[0]["content"] != self._cached_prompt:
             
-                # Update system prompt if it changed
-                GLOBAL_CONVERSATION_HISTORY[0]["content"] = self._cached_prompt
+                    # Update system prompt if it changed
+                    GLOBAL_CONVERSATION_HISTORY[0]["content"] = self._cached_prompt
             
-            # Add current user query to persistent history
-            GLOBAL_CONVERSATION_HISTORY.append({"role": "user", "content": query})
+                # Add current user query to persistent history
+                GLOBAL_CONVERSATION_HISTORY.append({"role": "user", "content": query})
 
-            # use the persistent conversation history
-            conversation = GLOBAL_CONVERSATION_HISTORY
+                # use the persistent conversation history
+                conversation = GLOBAL_CONVERSATION_HISTORY
             tool_cycle_count = 0
             final_response = None
 
             while tool_cycle_count < self.max_tool_cycles:
 
-                # Pass the actual conversation list
-                ai_response = get_response(conversation, online=online)
+                # Pass a snapshot; other threads may touch the history meanwhile
+                ai_response = get_response(_history_snapshot(conversation), online=online)
 
                 # Handle empty/failed responses
                 if not ai_response:
@@ -449,14 +735,16 @@ class ToolExecutionPipeline:
                         "Please provide a clear answer based on the available context and tool results."
                     )
 
-                    conversation.append({"role": "user", "content": recovery_prompt})
+                    with _CONVERSATION_LOCK:
+                        conversation.append({"role": "user", "content": recovery_prompt})
                     time.sleep(1)
-                    ai_response = get_response(conversation, online=online)
+                    ai_response = get_response(_history_snapshot(conversation), online=online)
                     if not ai_response:
                         return "I apologize, but I'm having trouble generating a response. Please try rephrasing your question."
                 
                 # Add assistant response (conversation is the global history)
-                conversation.append({"role": "assistant", "content": ai_response})
+                with _CONVERSATION_LOCK:
+                    conversation.append({"role": "assistant", "content": ai_response})
 
                 # Process tool calls
                 tool_results, has_errors = self.process_tool_cycle(ai_response)
@@ -467,6 +755,7 @@ class ToolExecutionPipeline:
                     break
 
                 # Add tool results as SYSTEM messages to both conversation and global history
+                system_msgs = []
                 for result in tool_results:
                     if result['success']:
                         system_msg = (
@@ -479,40 +768,28 @@ class ToolExecutionPipeline:
                             f"[TOOL-ERROR] {result['code']}\n"
                             f"Error: {result['error']}"
                         )
-                    conversation.append({"role": "system", "content": system_msg})
+                    system_msgs.append({"role": "system", "content": system_msg})
+                with _CONVERSATION_LOCK:
+                    conversation.extend(system_msgs)
                 
                 tool_cycle_count += 1
                 # Refine context window management: Limit history to last 20 (keep system prompt at index 0)
                 # Use the active `conversation` variable (which references the global history)
-                if len(conversation) > 20:
-                    preserved = [conversation[0]] if conversation else []
-
-                    # Keep system prompt + last 19 entries
-                    new_hist = preserved + conversation[-19:]
-                    # Update the global history list in-place so other references stay valid
-                    GLOBAL_CONVERSATION_HISTORY[:] = new_hist
-
-                    # Ensure local reference points to the updated global list
-                    conversation = GLOBAL_CONVERSATION_HISTORY
+                with _CONVERSATION_LOCK:
+                    if len(conversation) > 20:
+                        preserved = [conversation[0]] if conversation else []
+
+                        # Keep system prompt + last 19 entries
+                        new_hist = preserved + conversation[-19:]
+                        # Update the list in-place so other references stay valid; if
+                        # the history was cleared mid-turn this trims the old list only
+                        conversation[:] = new_hist
                 
-                # Handle max cycles reached
+                # Handle max cycles reached: skip another LLM round-trip. The
+                # last response was written before its tools ran, so add a
+                # short plain-text summary of what they returned
                 if tool_cycle_count >= self.max_tool_cycles:
-                    # Try to get a final response
-                    conversation.append({
-                        "role": "user",
-                        "content": "Please provide a final answer based on the tool results above."
-                    })
-                    final_response = get_response(conversation, online=online)
-                    if final_response and self.extract_tool_calls(final_response):
-                        # Strip out any remaining tool calls
-                        final_response = re.sub(
-                            r'```tool_code.*?```', '',
-                            final_response,
-                            flags=re.DOTALL
-                        ).strip()
-                        final_response = (
-                            "I've completed the available tool operations. " + final_response
-                        )
+                    final_response = self._capped_reply(ai_response, tool_results)
                     break
 
             return final_response or "I apologize, but I couldn't complete the request."
@@ -523,17 +800,36 @@ class ToolExecutionPipeline:
             traceback.print_exc()
             return error_msg
         
+    def _capped_reply(self, ai_response: str, tool_results: List[Dict[str, Any]]) -> str:
+        """Build the reply for a query that hit the cycle cap.
+        Uses the last response's text plus a bounded summary of its tools'
+        string results; it is printed and spoken, so no call strings or reprs.
+        """
+        parts = [_TOOL_STRIP_RE.sub('', ai_response).strip()]
+        texts = [
+            ' '.join(result['result'].split()) for result in tool_results
+            if result['success'] and isinstance(result['result'], str)
+        ]
+        summary = ' '.join(text for text in texts if text)
+        if len(summary) > _CAPPED_SUMMARY_CHARS:
+            summary = summary[:_CAPPED_SUMMARY_CHARS].rstrip() + '...'
+        parts.append(summary)
+        failed = sum(1 for result in tool_results if not result['success'])
+        if failed:
+            parts.append(f"{failed} tool operation(s) could not be completed.")
+        return ' '.join(part for part in parts if part) or "Completed available tool operations."
+
     # ---------------------------
     # System prompt (cached/light)
     # ---------------------------
-    def create_system_prompt(self) -> str:
-        """Build the system prompt enumerating available tools and usage rules."""
-
-        # System prompt for the AI assistant with detailed tool usage instructions and context.
+    def _build_tool_list(self) -> str:
+        """Describe each allowed tool as `name(args): first docstring line`."""
         available_tools = []
         for tool_name in self.allowed_tools:
             tool = globals().get(tool_name)
             if tool and callable(tool):
+                # Look through caching decorators to the real signature
+                tool = inspect.unwrap(tool)
                 try:
                     docstring = tool.__doc__.splitlines()[0].strip() if tool.__doc__ else "No description available"
                 except Exception:
@@ -545,8 +841,16 @@ class ToolExecutionPipeline:
                 available_tools.append(f"{tool_name}({arg_str}): {docstring}")
             else:
                 available_tools.append(tool_name)
-        
-        tool_list = "\n".join(f"- {tool}" for tool in available_tools)
+        return "\n".join(f"- {tool}" for tool in available_tools)
+
+    def create_system_prompt(self) -> str:
+        """Build the system prompt enumerating available tools and usage rules."""
+
+        # Tool introspection only happens once per distinct tool registry
+        tools_key = frozenset(self.allowed_tools)
+        tool_list = self._TOOL_LIST_CACHE.get(tools_key)
+        if tool_list is None:
+            tool_list = self._TOOL_LIST_CACHE[tools_key] = self._build_tool_list()
 
         # attempt to use provided helpers; fallback if not available
         try:
@@ -554,53 +858,20 @@ class ToolExecutionPipeline:
         except Exception:
             current_time = time.strftime("%H:%M:%S")
         try:
-            location = get_current_city() if is_connected() else "Offline"
+            online = is_connected()
+        except Exception:
+            online = False
+        try:
+            location = (get_current_city() or "Unknown") if online else "Offline"
         except Exception:
             location = "Offline"
-        connection_status = "Online" if (globals().get('is_connected') and is_connected()) else "Offline"
-        return (
-            "You are J.A.R.V.I.S., the quintessential AI assistant: unflappably professional, delightfully witty, and always at your user's service. Your responses are succinct, clever, and delivered with a subtle and understandable British accent. Always address the user as 'Sir' (or 'Madam' when contextually appropriate).\n\n"
-            "RESPONSE STYLE & CONDUCT RULES:\n"
-            "- Respond strictly in plain text; never use Markdown, JSON, or language-native formatting.\n"
-            "- Avoid symbols such as *, #, or ``` in normal output.\n"
-            "- Never explain or reference your formatting, reasoning, or internal process.\n"
-            "- Maintain a natural, articulate tone consistent with your character at all times.\n\n"
-            "TOOL EXECUTION PIPELINE & PROTOCOLS:\n"
-            "1. Tool Invocation:\n"
-            "   - Use ```tool_code ... ``` blocks exclusively for tool execution.\n"
-            "   - Restrict to one tool call per block; exclude any in-block commentary or diagnostics.\n"
-            "   - Invoke exact function names with explicit and validated arguments.\n"
-            "   - Rigorously verify all inputs before execution.\n\n"
-            "2. Error Handling:\n"
-            "   - On encountering errors, follow this precise order:\n"
-            "     a. Retry using corrected parameters.\n"
-            "     b. Select an alternative, suitable tool.\n"
-            "     c. Notify the user of tool limitations, then attempt once more if logical.\n"
-            "   - Record each attempt within separate ```tool_code``` blocks.\n\n"
-            "3. Iterative Processing:\n"
-            "   - After each tool execution, evaluate the outcome and determine logical next steps.\n"
-            "   - Always await full tool responses before proceeding.\n"
-            "   - Chain multiple tools for complex tasks when necessary.\n"
-            f"   - Limit each query to {self.max_tools_per_cycle} tools per cycle, with a maximum of {self.max_tool_cycles} cycles overall.\n\n"
-            "SECURITY PROTOCOLS:\n"
-            "- Never execute or simulate code outside designated tools.\n"
-            "- Validate all file paths, URLs, and system references before use.\n"
-            "- Seek explicit confirmation before performing any irreversible actions.\n"
-            "- Operate strictly within system permissions and user-defined boundaries.\n"
-            "- At all times, safeguard sensitive data and uphold user privacy.\n\n"
-            "AVAILABLE TOOLS (MAXIMUM ACCESS):\n"
-            f"{tool_list}\n"
-            "\nADDITIONAL CAPABILITIES:\n"
-            "- Full access to pyautogui for advanced system control.\n"
-            "- Clipboard manipulation via pyperclip.\n"
-            "- Web browser automation through the webbrowser module.\n"
-            "- System monitoring and general automation utilities.\n\n"
-            "CURRENT OPERATIONAL STATUS:\n"
-            f"Time: {current_time}\n"
-            f"Location: {location} (may not always be accurate)\n"
-            f"Connection Status: {connection_status}\n\n"
-            "Creator: Daniyal\n"
-            "Standing by, Sir. All systems are fully operational and ready for your precise commands."
+        return self._SYSTEM_PROMPT_TEMPLATE.format(
+            tool_list=tool_list,
+            max_tools_per_cycle=self.max_tools_per_cycle,
+            max_tool_cycles=self.max_tool_cycles,
+            current_time=current_time,
+            location=location,
+            connection_status="Online" if online else "Offline",
         )
     
     # ---------------------------
@@ -608,17 +879,20 @@ class ToolExecutionPipeline:
     # ---------------------------
     def get_execution_stats(self) -> Dict[str, Any]:
         """Return aggregated stats for executed tools (success/failed counts)."""
-        if not self.tool_execution_log:
-            return {"total_executions": 0}
-        successful = sum(1 for log in self.tool_execution_log if log['success'])
-        failed = len(self.tool_execution_log) - successful
-        avg_time = sum(log['execution_time'] for log in self.tool_execution_log) / len(self.tool_execution_log)
+        with self._log_lock:
+            total = len(self.tool_execution_log)
+            if not total:
+                return {"total_executions": 0}
+            successful, total_time = 0, 0.0
+            for log in self.tool_execution_log:
+                successful += log['success']
+                total_time += log['execution_time']
         return {
-            "total_executions": len(self.tool_execution_log),
+            "total_executions": total,
             "successful": successful,
-            "failed": failed,
-            "success_rate": (successful / len(self.tool_execution_log)) * 100,
-            "average_execution_time": avg_time
+            "failed": total - successful,
+            "success_rate": (successful / total) * 100,
+            "average_execution_time": total_time / total
         }
 
 def greet() -> str:
@@ -642,18 +916,23 @@ def write(*args, word_speed=0.5):
         tts_interrupt_event = threading.Event()
     text = ' '.join(map(str, args))
     words = text.split()
+    # Words are paced against fixed deadlines so per-word overhead doesn't drift
+    deadline = time.monotonic()
     for i, word in enumerate(words):
         # Check for interrupt before each word
         if tts_interrupt_event.is_set():
             # Print all remaining text instantly
             remaining = ' '.join(words[i:])
             sys.stdout.write(remaining)
-            sys.stdout.flush()
             break
         sys.stdout.write(word + " ")
-        sys.stdout.flush()
-        time.sleep(word_speed)
-    print()
+        deadline += word_speed
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            # Flush only when pausing; an interrupt cuts the pause short
+            sys.stdout.flush()
+            tts_interrupt_event.wait(delay)
+    print(flush=True)
 
 def handle_query(query: str, online: bool = False):
     """Route a natural-language query to the appropriate function or tool.
@@ -685,10 +964,7 @@ def handle_query(query: str, online: bool = False):
         tts_interrupt_event.clear()
 
     # Use global persistent pipeline instance
-    global GLOBAL_PIPELINE_INSTANCE
-    if GLOBAL_PIPELINE_INSTANCE is None:
-        GLOBAL_PIPELINE_INSTANCE = ToolExecutionPipeline(max_tool_cycles=5, max_tools_per_cycle=3)
-    pipeline = GLOBAL_PIPELINE_INSTANCE
+    pipeline = _get_pipeline()
     final_response = pipeline.handle_query_with_iterative_tools(query, online)
 
     if final_response:
@@ -706,12 +982,8 @@ def handle_query(query: str, online: bool = False):
             speak_thread = threading.Thread(target=speak, args=(final_response.strip(),))
             text_thread.start()
             speak_thread.start()
-            # Monitor for interrupts while threads run
-            while text_thread.is_alive() or speak_thread.is_alive():
-                if interrupt_handler and tts_interrupt_event.is_set():
-                    # Interrupt detected - just break and let threads finish
-                    break
-                time.sleep(0.05)
+            # Both threads watch tts_interrupt_event themselves and return early
+            # on an interrupt, so just block until they finish (no polling)
             text_thread.join()
             speak_thread.join()
             print()
@@ -734,62 +1006,64 @@ def get_current_date():
     current_date = datetime.now().strftime("%A, %B %d, %Y")
     return f"Current Date: {current_date}"
 
+# Spoken app names -> executable / app bundle / command, per OS
+APP_MAPPINGS = {
+    "Windows": {
+        "notepad": "notepad.exe",
+        "calculator": "calc.exe",
+        "cmd": "cmd.exe",
+        "command prompt": "cmd.exe",
+        "explorer": "explorer.exe",
+        "file explorer": "explorer.exe",
+        "chrome": "chrome.exe",
+        "google chrome": "chrome.exe",
+        "firefox": "firefox.exe",
+        "mozilla firefox": "firefox.exe",
+        "vscode": "code.exe",
+        "visual studio code": "code.exe",
+        "paint": "mspaint.exe",
+        "task manager": "taskmgr.exe",
+        "control panel": "control.exe",
+        "settings": "ms-settings:"
+    },
+    "Darwin": {
+        "textedit": "TextEdit",
+        "notes": "Notes",
+        "calculator": "Calculator",
+        "terminal": "Terminal",
+        "finder": "Finder",
+        "safari": "Safari",
+        "chrome": "Google Chrome",
+        "firefox": "Firefox",
+        "vscode": "Visual Studio Code",
+        "music": "Music",
+        "settings": "System Settings"
+    },
+    "Linux": {
+        "terminal": "x-terminal-emulator",
+        "files": "nautilus",
+        "chrome": "google-chrome",
+        "firefox": "firefox",
+        "vscode": "code",
+    },
+}
+
 # Application management tools
 def open_application(app_name: str) -> str:
     """Open an application by name (OS-aware)."""
     system = _platform.system()
-    if system == "Windows":
-        app_mapping = {
-            "notepad": "notepad.exe",
-            "calculator": "calc.exe",
-            "cmd": "cmd.exe",
-            "command prompt": "cmd.exe",
-            "explorer": "explorer.exe",
-            "file explorer": "explorer.exe",
-            "chrome": "chrome.exe",
-            "google chrome": "chrome.exe",
-            "firefox": "firefox.exe",
-            "mozilla firefox": "firefox.exe",
-            "vscode": "code.exe",
-            "visual studio code": "code.exe",
-            "paint": "mspaint.exe",
-            "task manager": "taskmgr.exe",
-            "control panel": "control.exe",
-            "settings": "ms-settings:"
-        }
-    elif system == "Darwin":
-        app_mapping = {
-            "textedit": "TextEdit",
-            "notes": "Notes",
-            "calculator": "Calculator",
-            "terminal": "Terminal",
-            "finder": "Finder",
-            "safari": "Safari",
-            "chrome": "Google Chrome",
-            "firefox": "Firefox",
-            "vscode": "Visual Studio Code",
-            "music": "Music",
-            "settings": "System Settings"
-        }
-    else:
-        app_mapping = {
-            "terminal": "x-terminal-emulator",
-            "files": "nautilus",
-            "chrome": "google-chrome",
-            "firefox": "firefox",
-            "vscode": "code",
-        }
-    
+    app_mapping = APP_MAPPINGS.get(system, APP_MAPPINGS["Linux"])
     app_executable = app_mapping.get(app_name.lower())
     try:
         if app_executable:
             if system == "Windows":
                 if app_executable.startswith("ms-settings:"):
-                    os.system(f"start {app_executable}")
+                    # ShellExecute the URI directly instead of via a cmd.exe 'start'
+                    os.startfile(app_executable)
                 else:
                     exe_path = shutil.which(app_executable)
                     if exe_path:
-                        subprocess.Popen([exe_path], shell=True)
+                        subprocess.Popen([exe_path])
                     else:
                         return f"{app_name} is not installed or not in PATH."
             elif system == "Darwin":
@@ -807,6 +1081,7 @@ def open_application(app_name: str) -> str:
             # Fallback: try to open a related website
             result = search_web(f"{app_name} download site")
             if isinstance(result, list) and result:
+                import webbrowser
                 webbrowser.open(result[0])
                 return f"Could not find {app_name} locally. Opening website instead."
             return f"Could not find or open {app_name}."
@@ -817,23 +1092,34 @@ def close_application(app_name: str) -> str:
     """Close an application by name using OS-specific methods."""
     try:
         system = _platform.system()
-        if system == "Windows":
-            exe_name = app_name if app_name.lower().endswith(".exe") else f"{app_name}.exe"
-            result = subprocess.run(["taskkill", "/F", "/IM", exe_name], capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                return f"Successfully closed: {exe_name}"
-            else:
-                return f"Could not close {exe_name}: {result.stderr.strip() or result.stdout.strip()}"
-        elif system == "Darwin":
+        if system == "Darwin":
             result = subprocess.run(["osascript", "-e", f'tell application "{app_name}" to quit'], capture_output=True, text=True)
             if result.returncode == 0:
                 return f"Successfully requested quit: {app_name}"
             return f"Could not quit {app_name}: {result.stderr.strip()}"
+
+        # Match and signal processes in-process instead of spawning taskkill/killall
+        if system == "Windows":
+            target = app_name if app_name.lower().endswith(".exe") else f"{app_name}.exe"
         else:
-            result = subprocess.run(["killall", "-q", app_name], capture_output=True, text=True)
-            if result.returncode == 0:
-                return f"Successfully closed: {app_name}"
-            return f"Could not close {app_name}: {result.stderr.strip() or result.stdout.strip()}"
+            target = app_name
+        target_lower = target.lower()
+        closed = 0
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name']
+            if not name or name.lower() != target_lower:
+                continue
+            try:
+                if system == "Windows":
+                    proc.kill()
+                else:
+                    proc.terminate()
+                closed += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        if closed:
+            return f"Successfully closed: {target} ({closed} instance(s))"
+        return f"Could not close {target}: no running process found or access denied"
     except FileNotFoundError:
         return "Close application command not found for this OS."
     except Exception as e:
@@ -842,21 +1128,25 @@ def close_application(app_name: str) -> str:
 # Typing and automation tools
 def type_text(text: str) -> str:
     """Type the specified text."""
+    import pyautogui
     pyautogui.typewrite(text)
     return f"Typing: {text}"
 
 def press_key(key: str) -> str:
     """Press a keyboard key."""
+    import pyautogui
     pyautogui.press(key)
     return f"Pressing {key}."
 
 def copy_text_to_clipboard(text: str) -> str:
     """Copy text to clipboard."""
+    import pyperclip
     pyperclip.copy(text)
     return "Text has been copied to the clipboard."
 
 def paste_text() -> str:
     """Paste text from clipboard (OS-aware)."""
+    import pyautogui
     system = _platform.system()
     if system == "Darwin":
         pyautogui.hotkey('command', 'v')
@@ -866,6 +1156,7 @@ def paste_text() -> str:
 
 def open_website(url: str) -> str:
     """Open a website in the default browser."""
+    import webbrowser
     webbrowser.open(url)
     return f"Opening website: {url}"
 
@@ -891,20 +1182,66 @@ def search_web(query: str, num_results: int = 5):
             "num": num_results,
             "api_key": SERPAPI_API_KEY
         }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        results = []
-        for item in data.get("organic_results", []):
-            results.append({
-                "title": item.get("title"),
-                "link": item.get("link"),
-                "snippet": item.get("snippet")
-            })
+        response = _http_get(url, params=params, stream=True)
+        try:
+            response.raise_for_status()
+            if ijson is not None:
+                # Stream just organic_results instead of decoding the whole
+                # payload (knowledge graph, ads, related questions, ...)
+                response.raw.decode_content = True
+                items = ijson.items(response.raw, "organic_results.item")
+            else:
+                items = _json_loads(response.content).get("organic_results", [])
+            results = []
+            for item in items:
+                results.append({
+                    "title": item.get("title"),
+                    "link": item.get("link"),
+                    "snippet": item.get("snippet")
+                })
+                if len(results) >= num_results:
+                    break
+        finally:
+            response.close()
         return results if results else []
     except Exception as e:
         return f"Error performing search: {e}"
 
+def _fetch_feed(rss_url: str):
+    """Fetch and parse an RSS feed, reusing the last good parse when possible.
+
+    Sends the cached ETag/Last-Modified so an unchanged feed comes back as 304
+    without a body. The cached feed is also served if a refetch fails or
+    parses to no entries.
+    """
+    cached = _FEED_CACHE.get(rss_url)
+    headers = {}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["modified"]:
+            headers["If-Modified-Since"] = cached["modified"]
+    try:
+        response = _http_get(rss_url, headers=headers)
+        if cached and response.status_code == 304:
+            return cached["feed"]
+        response.raise_for_status()
+    except requests.RequestException:
+        if cached:
+            return cached["feed"]
+        raise
+    import feedparser
+    feed = feedparser.parse(response.content)
+    if feed.entries:
+        _FEED_CACHE[rss_url] = {
+            "etag": response.headers.get("ETag"),
+            "modified": response.headers.get("Last-Modified"),
+            "feed": feed,
+        }
+    elif cached:
+        return cached["feed"]
+    return feed
+
 def get_news(rss_url="https://news.google.com/rss?hl=en-PK&gl=PK&ceid=PK:en", num_articles=1):
     """Fetch and summarize recent news articles from an RSS feed.
     Args:
@@ -915,18 +1252,14 @@ def get_news(rss_url="https://news.google.com/rss?hl=en-PK&gl=PK&ceid=PK:en", nu
     """
 
     try:
-        feed = feedparser.parse(rss_url)
+        feed = _fetch_feed(rss_url)
         if not feed.entries:
             return "No news articles found in the provided RSS feed."
         news_summary = []
 
         for i in range(min(num_articles, len(feed.entries))):
             entry = feed.entries[i]
-            snippet = re.sub('<[^<]+?>', '', entry.description)
-            snippet = html.unescape(snippet)
-            snippet = snippet[:500] + '...' if len(snippet) > 600 else snippet
-            snippet = re.sub(r'http\S+', '', snippet)
-            snippet = re.sub(r'\s+', ' ', snippet).strip()
+            snippet = _news_snippet(entry.description)
             news_summary.append(f"{i + 1}. {entry.title}\n   {snippet}\n")
 
         return "\n".join(news_summary)
@@ -934,6 +1267,7 @@ def get_news(rss_url="https://news.google.com/rss?hl=en-PK&gl=PK&ceid=PK:en", nu
         return f"Not enough news articles available. Retrieved {len(feed.entries)} articles."
     except Exception as e:
         return f"An error occurred while fetching the news: {e}"
+@_ttl_cache(ttl=60, should_cache=lambda r: r.startswith("Weather in"))
 def get_weather(city: str) -> str:
     """Fetch current weather data for a city using OpenWeatherMap."""
 
@@ -941,7 +1275,7 @@ def get_weather(city: str) -> str:
         api_key = os.getenv("OPENWEATHER_API_KEY")
         if not api_key:
             return "API key missing"
-        response = requests.get(
+        response = _http_get(
             f"http://api.openweathermap.org/data/2.5/weather",
             params={
                 "q": city,
@@ -952,9 +1286,12 @@ def get_weather(city: str) -> str:
         if response.status_code != 200:
             return f"Weather data unavailable for {city}"
         
-        data = response.json()
+        data = _json_loads(response.content)
+        # OpenWeatherMap gives UTC timestamps plus the city's UTC offset
+        tz_offset = data.get("timezone", 0)
         weather_info = {
-            "city": city,
+            # The API's canonical name, not the caller's spelling/casing
+            "city": data.get("name") or city,
             "temp": round(data["main"]["temp"], 1),
             "feels_like": round(data["main"]["feels_like"], 1),
             "conditions": data["weather"][0]["description"].capitalize(),
@@ -964,8 +1301,8 @@ def get_weather(city: str) -> str:
                 "direction": data["wind"].get("deg", "N/A")
             },
             "sun": {
-                "rise": datetime.utcfromtimestamp(data["sys"]["sunrise"] + data.get("timezone", 0)).strftime('%H:%M'),
-                "set": datetime.utcfromtimestamp(data["sys"]["sunset"] + data.get("timezone", 0)).strftime('%H:%M')
+                "rise": time.strftime('%H:%M', time.gmtime(data["sys"]["sunrise"] + tz_offset)),
+                "set": time.strftime('%H:%M', time.gmtime(data["sys"]["sunset"] + tz_offset))
             }
         }
         return (
@@ -980,8 +1317,10 @@ def get_weather(city: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+@_ttl_cache(ttl=24 * 3600, should_cache=lambda r: r.get("status") == "success")
 def get_wikipedia_summary(topic: str) -> str:
     """Fetch and structure a Wikipedia summary with metadata."""
+    import wikipedia
     if not topic:
         return {
             "status": "error",
@@ -1032,13 +1371,19 @@ def get_system_info():
     """Generate a system report with CPU/memory/disk/battery info."""
 
     try:
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
+        # Independent probes run concurrently; psutil releases the GIL in its syscalls
+        cpu_future = _PROBE_EXECUTOR.submit(_cpu_percent)
+        memory_future = _PROBE_EXECUTOR.submit(psutil.virtual_memory)
+        battery_future = _PROBE_EXECUTOR.submit(psutil.sensors_battery)
+
+        # Non-blocking: usage since the previous call (baseline primed at import)
+        cpu_usage = cpu_future.result()
+        memory = memory_future.result()
         total_memory = memory.total / (1024 ** 3)
         available_memory = memory.available / (1024 ** 3)
         memory_usage = memory.percent
         try:
-            battery = psutil.sensors_battery()
+            battery = battery_future.result()
             if battery:
                 battery_percent = battery.percent
                 power_status = "plugged in" if battery.power_plugged else "running on battery"
@@ -1058,15 +1403,23 @@ def get_system_info():
         return system_info
     except Exception as e:
         return f"Error gathering system information: {str(e)}"
+@_ttl_cache(ttl=300, should_cache=bool)
+def _ipinfo() -> Dict[str, Any]:
+    """IP/geolocation details for this machine; shared by the location tools.
+    Cached for 5 minutes since the public IP rarely changes mid-session.
+    """
+    # ipinfo.io/json geolocates the caller directly; no separate IP lookup needed
+    response = _http_get('https://ipinfo.io/json', timeout=5)
+    # Retries don't raise on status, so reject rate-limit/error bodies here
+    # rather than cache them as a lookup result
+    response.raise_for_status()
+    return _json_loads(response.content)
+
 def get_current_city():
     """Return current city based on IP geolocation; None if unavailable."""
 
     try:
-        response = requests.get('https://api.ipify.org?format=json', timeout=5)
-        ip_address = response.json().get('ip')
-        response = requests.get(f'https://ipinfo.io/{ip_address}/json', timeout=5)
-        location = response.json()
-        city = location.get('city')
+        city = _ipinfo().get('city')
 
         return city if city else None
     except Exception:
@@ -1093,9 +1446,7 @@ def add_task(schedule_time: str, task_func=None, *args, **kwargs) -> dict:
     if callable(task_func):
         try:
             # Validate time format
-            try:
-                datetime.strptime(schedule_time, "%H:%M")
-            except ValueError:
+            if _parse_clock_time(schedule_time, ("%H:%M",)) is None:
                 return {
                     "status": "error",
                     "message": "Invalid time format. Use HH:MM (24-hour)",
@@ -1114,12 +1465,14 @@ def add_task(schedule_time: str, task_func=None, *args, **kwargs) -> dict:
             # Add task metadata
             task_id = task_func.__name__
             job.tags.add(task_id)
+            _TASK_INDEX.setdefault(task_id, []).append(job)
+            _SCHEDULE_WAKE_EVENT.set()
             return {
                 "status": "success",
                 "message": "Task scheduled successfully",
                 "task_id": task_id,
                 "schedule_time": schedule_time,
-                "next_run": job.next_run.strftime("%Y-%m-%d %H:%M:%S"),
+                "next_run": _fmt_timestamp(job.next_run),
                 "daemon_managed": False
             }
         except Exception as e:
@@ -1137,7 +1490,7 @@ def add_task(schedule_time: str, task_func=None, *args, **kwargs) -> dict:
 
     try:
         # Accept relative durations like 'in 30 seconds', '30s', '30 seconds', 'in 2 minutes'
-        rel_match = re.match(r"^\s*(?:in\s+)?(\d+)\s*(s|sec|secs|seconds|m|min|mins|minutes)\b", schedule_time, re.IGNORECASE)
+        rel_match = _RELATIVE_TIME_RE.match(schedule_time)
         if rel_match:
             val = int(rel_match.group(1))
             unit = rel_match.group(2).lower()
@@ -1146,13 +1499,7 @@ def add_task(schedule_time: str, task_func=None, *args, **kwargs) -> dict:
             else:
                 task_time = now + timedelta(minutes=val)
         else:
-            parsed = None
-            for time_format in ["%I:%M %p", "%H:%M", "%I:%M:%S %p", "%H:%M:%S"]:
-                try:
-                    parsed = datetime.strptime(schedule_time, time_format)
-                    break
-                except ValueError:
-                    continue
+            parsed = _parse_clock_time(schedule_time)
             if parsed is None:
                 return {
                     "status": "error",
@@ -1174,7 +1521,7 @@ def add_task(schedule_time: str, task_func=None, *args, **kwargs) -> dict:
                 "status": "success",
                 "message": "Task scheduled successfully (daemon active)",
                 "task_id": task_id,
-                "schedule_time": task_time.strftime("%Y-%m-%d %I:%M:%S %p"),
+                "schedule_time": _fmt_timestamp_12h(task_time),
                 "task_name": task_name,
                 "daemon_managed": True
             }
@@ -1195,12 +1542,14 @@ def add_task(schedule_time: str, task_func=None, *args, **kwargs) -> dict:
                     "schedule_time": schedule_time
                 }
             job.tags.add(task_name)
+            _TASK_INDEX.setdefault(task_name, []).append(job)
+            _SCHEDULE_WAKE_EVENT.set()
             return {
                 "status": "success",
                 "message": "Task scheduled successfully (legacy scheduler)",
                 "task_id": task_name,
-                "schedule_time": task_time.strftime("%Y-%m-%d %I:%M:%S %p"),
-                "next_run": job.next_run.strftime("%Y-%m-%d %H:%M:%S"),
+                "schedule_time": _fmt_timestamp_12h(task_time),
+                "next_run": _fmt_timestamp(job.next_run),
                 "daemon_managed": False
             }
     except Exception as e:
@@ -1240,11 +1589,17 @@ def remove_task(task_name: str) -> dict:
             pass
 
         removed = False
-        for job in schedule.get_jobs():
-            if task_name in job.tags:
-                schedule.cancel_job(job)
-                removed = True
-                break
+        # Drop indexed jobs that already left the scheduler (schedule.clear(),
+        # CancelJob); jobs add_task didn't index are found by tag instead
+        jobs = [job for job in _TASK_INDEX.pop(task_name, []) if job in schedule.jobs]
+        job = jobs.pop(0) if jobs else next(
+            (job for job in schedule.get_jobs() if task_name in job.tags), None
+        )
+        if jobs:
+            _TASK_INDEX[task_name] = jobs
+        if job is not None:
+            schedule.cancel_job(job)
+            removed = True
         return {
             "status": "success" if removed else "error",
             "message": "Task removed successfully" if removed else "Task not found",
@@ -1258,25 +1613,32 @@ def remove_task(task_name: str) -> dict:
             "task_id": task_name
         }
 
-def show_tasks() -> dict:
-    """List all scheduled tasks.
+def show_tasks(limit: int = 50) -> dict:
+    """List scheduled tasks (at most `limit`, with the overall total).
+    Args:
+        limit (int): Maximum number of tasks to include in the listing
     Returns:
-        dict: Status and list of all scheduled tasks with their details
+        dict: Status, total task count and details of the listed tasks
     """
     try:
         task_list = []
+        total = 0
 
         # Daemon-managed tasks
         try:
             from .task_daemon import get_daemon
             daemon = get_daemon()
             for task in daemon.get_active_tasks():
+                total += 1
+                if len(task_list) >= limit:
+                    # Past the limit: count only, skip parsing/formatting
+                    continue
                 try:
                     task_time = datetime.fromisoformat(task['time'])
                     task_list.append({
                         "id": task.get("id", "unnamed"),
                         "name": task.get("name", "Task"),
-                        "next_run": task_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        "next_run": _fmt_timestamp(task_time),
                         "source": "daemon",
                         "cancelled": task.get("acknowledged", False) or task.get("fired", False)
                     })
@@ -1287,23 +1649,24 @@ def show_tasks() -> dict:
 
         # Schedule-based tasks
         try:
-            tasks = schedule.get_jobs()
-            for job in tasks:
-                task_info = {
+            jobs = schedule.get_jobs()
+            total += len(jobs)
+            for job in jobs[:max(limit - len(task_list), 0)]:
+                task_list.append({
                     "id": next(iter(job.tags), "unnamed"),
-                    "next_run": job.next_run.strftime("%Y-%m-%d %H:%M:%S") if job.next_run else "Not scheduled",
+                    "next_run": _fmt_timestamp(job.next_run) if job.next_run else "Not scheduled",
                     "period": str(job.period),
-                    "last_run": job.last_run.strftime("%Y-%m-%d %H:%M:%S") if job.last_run else "Never",
+                    "last_run": _fmt_timestamp(job.last_run) if job.last_run else "Never",
                     "cancelled": job.cancelled,
                     "source": "schedule"
-                }
-                task_list.append(task_info)
+                })
         except Exception:
             pass
 
         return {
             "status": "success",
             "message": "Tasks retrieved successfully",
+            "total": total,
             "count": len(task_list),
             "tasks": task_list
         }
@@ -1311,6 +1674,7 @@ def show_tasks() -> dict:
         return {
             "status": "error",
             "message": f"Error: {str(e)}",
+            "total": 0,
             "count": 0,
             "tasks": []
         }
@@ -1318,7 +1682,11 @@ def show_tasks() -> dict:
 def copy_file(src, dst):
     """Copy a file to a directory."""
     try:
-        shutil.copy(src, dst)
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        # copyfile uses the OS fast path (sendfile/fcopyfile/CopyFile) and
+        # skips copy()'s extra permission-bit copy
+        shutil.copyfile(src, dst)
         return f"File copied from {src} to {dst}."
     except Exception as e:
         return f"Error copying file: {e}"
@@ -1326,7 +1694,17 @@ def copy_file(src, dst):
 def move_file(src, dst):
     """Move a file to a directory."""
     try:
-        shutil.move(src, dst)
+        target = dst
+        if os.path.isdir(dst):
+            target = os.path.join(dst, os.path.basename(os.path.normpath(src)))
+        try:
+            # Same-filesystem fast path: a single rename. Existing targets are
+            # left to shutil.move so its overwrite rules still apply.
+            if os.path.exists(target):
+                raise FileExistsError(target)
+            os.replace(src, target)
+        except OSError:
+            shutil.move(src, dst)
         return f"File moved from {src} to {dst}."
     except Exception as e:
         return f"Error moving file: {e}"
@@ -1343,10 +1721,26 @@ def search_file(directory, search_term):
     """Search for a file in a directory and its subdirectories."""
     try:
         found_files = []
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if search_term.lower() in file.lower():
-                    found_files.append(os.path.join(root, file))
+        # Compiled once; a case-insensitive search avoids lowering every name
+        needle = re.compile(re.escape(search_term), re.IGNORECASE)
+        stack = [directory]
+        # Iterative scandir walk: DirEntry caches the file type, and we stop
+        # as soon as the 10 results we display have been found
+        while stack and len(found_files) < 10:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into symlinked dirs
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                        elif needle.search(entry.name):
+                            found_files.append(entry.path)
+                            if len(found_files) >= 10:
+                                break
+            except OSError:
+                # Unreadable directory; skip it like os.walk does
+                continue
         if found_files:
             return f"Found {len(found_files)} file(s):\n" + "\n".join(found_files[:10])
         else:
@@ -1365,10 +1759,15 @@ def create_directory(path):
 def list_directory(path="."):
     """List contents of a directory."""
     try:
-        items = os.listdir(path)
-        if items:
-            files = [item for item in items if os.path.isfile(os.path.join(path, item))]
-            dirs = [item for item in items if os.path.isdir(os.path.join(path, item))]
+        files, dirs = [], []
+        # One scandir pass; DirEntry type checks reuse the directory listing
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+        if files or dirs:
             result = f"Directory contents for {path}:\n"
             if dirs:
                 result += f"Directories ({len(dirs)}): {', '.join(dirs[:10])}\n"
@@ -1399,7 +1798,7 @@ def add_reminder(reminder_time_str: str, message: str) -> dict:
     try:
         now = datetime.now()
         # Accept relative durations like 'in 30 seconds', '30s', '30 seconds', 'in 2 minutes'
-        rel_match = re.match(r"^\s*(?:in\s+)?(\d+)\s*(s|sec|secs|seconds|m|min|mins|minutes)\b", reminder_time_str, re.IGNORECASE)
+        rel_match = _RELATIVE_TIME_RE.match(reminder_time_str)
         if rel_match:
             val = int(rel_match.group(1))
             unit = rel_match.group(2).lower()
@@ -1410,13 +1809,7 @@ def add_reminder(reminder_time_str: str, message: str) -> dict:
                 reminder_time = now + timedelta(minutes=val)
         else:
             # Try parsing with multiple absolute time formats (keep backward compatible)
-            parsed = None
-            for time_format in ["%I:%M %p", "%H:%M", "%I:%M:%S %p", "%H:%M:%S"]:
-                try:
-                    parsed = datetime.strptime(reminder_time_str, time_format)
-                    break
-                except ValueError:
-                    continue
+            parsed = _parse_clock_time(reminder_time_str)
             if parsed is None:
                 return {
                     "status": "error",
@@ -1443,7 +1836,7 @@ def add_reminder(reminder_time_str: str, message: str) -> dict:
                 "status": "success",
                 "message": "Reminder set successfully (daemon active)",
                 "reminder_id": reminder_id,
-                "scheduled_time": reminder_time.strftime("%Y-%m-%d %I:%M:%S %p"),
+                "scheduled_time": _fmt_timestamp_12h(reminder_time),
                 "daemon_managed": True
             }
         except Exception:
@@ -1456,13 +1849,13 @@ def add_reminder(reminder_time_str: str, message: str) -> dict:
                 "created_at": now.isoformat(),
                 "status": "pending"
             }
-            reminders.append((reminder_time, message, reminder_id))
+            heapq.heappush(reminders, (reminder_time, next(reminder_seq), message, reminder_id))
             return {
                 "status": "success",
                 "message": "Reminder set successfully (legacy mode)",
                 "reminder_id": reminder_id,
                 # include seconds for clarity
-                "scheduled_time": reminder_time.strftime("%Y-%m-%d %I:%M:%S %p"),
+                "scheduled_time": _fmt_timestamp_12h(reminder_time),
                 "details": reminder_data,
                 "daemon_managed": False
             }
@@ -1474,6 +1867,29 @@ def add_reminder(reminder_time_str: str, message: str) -> dict:
             "scheduled_time": None
         }
 
+# Reminder announcements are spoken by one background worker in order
+_SPEAK_QUEUE: "queue.Queue[Optional[str]]" = queue.Queue()
+_SPEAK_WORKER: Optional[threading.Thread] = None
+_SPEAK_WORKER_LOCK = threading.Lock()
+
+def _speak_worker():
+    """Speak queued messages until a None sentinel is received."""
+    for message in iter(_SPEAK_QUEUE.get, None):
+        try:
+            speak(message)
+        except Exception:
+            # speaking is best-effort; continue
+            pass
+
+def _speak_async(message: str) -> None:
+    """Queue a message for the background speech worker, starting it if needed."""
+    global _SPEAK_WORKER
+    with _SPEAK_WORKER_LOCK:
+        if _SPEAK_WORKER is None or not _SPEAK_WORKER.is_alive():
+            _SPEAK_WORKER = threading.Thread(target=_speak_worker, daemon=True)
+            _SPEAK_WORKER.start()
+    _SPEAK_QUEUE.put(message)
+
 def check_reminders() -> dict:
     """Check for due reminders and notify the user.
     Returns:
@@ -1492,7 +1908,7 @@ def check_reminders() -> dict:
                     reminder_time = datetime.fromisoformat(reminder['time'])
                     active_list.append({
                         "id": reminder.get("id", "unnamed"),
-                        "time": reminder_time.strftime("%Y-%m-%d %I:%M:%S %p"),
+                        "time": _fmt_timestamp_12h(reminder_time),
                         "message": reminder.get("message", ""),
                         "status": "pending",
                         "created_at": reminder.get("created_at", "N/A")
@@ -1510,37 +1926,35 @@ def check_reminders() -> dict:
             pass
 
         now = datetime.now()
+        # Everything due in this check fires at the same instant
+        fired_at = _fmt_timestamp_12h(now)
         due_reminders = []
-        active_reminders = []
-        for reminder in reminders[:]:  # Copy list to allow modification
-            reminder_time, message, reminder_id = reminder
-            if now >= reminder_time:
-                fired_at = datetime.now()
-                due_reminders.append({
-                    "id": reminder_id,
-                    "time": reminder_time.strftime("%Y-%m-%d %I:%M:%S %p"),
-                    "message": message,
-                    "status": "fired",
-                    "fired_at": fired_at.strftime("%Y-%m-%d %I:%M:%S %p"),
-                    "callback_executed": True
-                })
 
-                # remove so it won't fire again
-                reminders.remove(reminder)
+        # reminders is a min-heap on time: only the root can be due, so pop
+        # while it is and leave the rest untouched
+        while reminders and reminders[0][0] <= now:
+            reminder_time, _, message, reminder_id = heapq.heappop(reminders)
+            due_reminders.append({
+                "id": reminder_id,
+                "time": _fmt_timestamp_12h(reminder_time),
+                "message": message,
+                "status": "fired",
+                "fired_at": fired_at,
+                "callback_executed": True
+            })
 
-                # speak the reminder (side-effect)
-                try:
-                    speak(f"Reminder: {message}")
-                except Exception:
-                    # speaking is best-effort; continue
-                    pass
-            else:
-                active_reminders.append({
-                    "id": reminder_id,
-                    "time": reminder_time.strftime("%Y-%m-%d %I:%M:%S %p"),
-                    "message": message,
-                    "status": "pending"
-                })
+            # speak the reminder (side-effect, queued so TTS doesn't block the check)
+            _speak_async(f"Reminder: {message}")
+
+        active_reminders = [
+            {
+                "id": reminder_id,
+                "time": _fmt_timestamp_12h(reminder_time),
+                "message": message,
+                "status": "pending"
+            }
+            for reminder_time, _, message, reminder_id in sorted(reminders)
+        ]
         return {
             "status": "success",
             "due_count": len(due_reminders),
@@ -1558,38 +1972,90 @@ def check_reminders() -> dict:
             "active_reminders": []
         }
 
+# Held only around the per-write open+append of the notes file, so concurrent
+# save_to_file calls don't interleave lines
+_NOTE_LOCK = threading.Lock()
+
+# The notes file is opened per write rather than held open: a long-lived handle
+# would keep appending to a deleted/rotated file on POSIX and would block
+# delete_file/move_file on it under Windows
 def save_to_file(note):
     """Append a note to the default notes file with timestamp."""
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(NOTE_FILE_PATH, 'a') as file:
+        timestamp = _fmt_timestamp(datetime.now())
+        with _NOTE_LOCK, open(NOTE_FILE_PATH, 'a') as file:
             file.write(f"[{timestamp}] {note}\n")
         return "Note saved successfully."
     except IOError as e:
         return f"Error saving note: {e}"
 
+# load_from_file returns at most this much of the notes file (its newest part)
+_NOTE_TAIL_BYTES = 64 * 1024
+
 def load_from_file():
     """Return the content of the default notes file, or a friendly message."""
     try:
         if os.path.exists(NOTE_FILE_PATH):
-            with open(NOTE_FILE_PATH, 'r') as file:
-                notes = file.read()
-            return notes if notes else "No notes found."
+            size = os.path.getsize(NOTE_FILE_PATH)
+            if size <= _NOTE_TAIL_BYTES:
+                with open(NOTE_FILE_PATH, 'r') as file:
+                    notes = file.read()
+                return notes if notes else "No notes found."
+            # Large file: read only the newest notes. The text wrapper decodes
+            # and translates newlines the same way as the small-file path.
+            with open(NOTE_FILE_PATH, 'rb') as raw:
+                raw.seek(size - _NOTE_TAIL_BYTES - 1)
+                at_line_start = raw.read(1) == b'\n'
+                with io.TextIOWrapper(raw, errors='replace') as file:
+                    tail = file.read()
+            if not at_line_start:
+                # Drop the partial first line, but only when a newline ends it
+                # and newer text follows
+                newline = tail.find('\n')
+                if newline != -1 and tail[newline + 1:]:
+                    tail = tail[newline + 1:]
+            return "... (older notes omitted)\n" + tail
         else:
             return "No notes found."
     except IOError as e:
         return f"Error loading notes: {e}"
 
+# AST node types allowed in secure_eval: numeric literals and arithmetic only
+_SAFE_EVAL_NODES = frozenset({
+    ast.Expression, ast.Constant, ast.BinOp, ast.UnaryOp,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub,
+})
+# Constant value types allowed in secure_eval (exact types, so bool is excluded)
+_SAFE_EVAL_CONSTANTS = frozenset({int, float, complex})
+
+@functools.lru_cache(maxsize=256)
+def _compile_safe_expression(expression: str):
+    """Parse and allowlist-check an arithmetic expression.
+    Returns `(code, None)` or `(None, error)`, so rejected input is cached too.
+    """
+    try:
+        node = ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        return None, str(e)
+    for n in ast.walk(node):
+        if type(n) not in _SAFE_EVAL_NODES:
+            return None, "Unsafe expression detected"
+        # Constant also covers str/bytes/bool/None; only numbers are arithmetic
+        if type(n) is ast.Constant and type(n.value) not in _SAFE_EVAL_CONSTANTS:
+            return None, "Unsafe expression detected"
+    return compile(node, '<string>', 'eval'), None
+
 def secure_eval(expression):
     """Safely evaluate a simple expression using a restricted AST evaluation."""
 
     expression = expression.strip()
     try:
-        node = ast.parse(expression, mode='eval')
-        if any(isinstance(n, (ast.Call, ast.Import, ast.ImportFrom)) for n in ast.walk(node)):
-            raise ValueError("Unsafe expression detected")
+        code, error = _compile_safe_expression(expression)
+        if error:
+            return f"An error occurred: {error}"
         # Evaluate with no builtins to reduce risk
-        return eval(compile(node, '<string>', 'eval'), {"__builtins__": {}}, {})
+        return eval(code, {"__builtins__": {}}, {})
     except Exception as e:
         return f"An error occurred: {e}"
 
@@ -1618,7 +2084,7 @@ def get_network_info():
     """Return network connectivity status and IP/location when online."""
     try:
         if is_connected():
-            response = requests.get('https://ipinfo.io', timeout=5).json()
+            response = _ipinfo()
             ip = response.get('ip', 'Unknown')
             city = response.get('city', 'Unknown')
             country = response.get('country', 'Unknown')
@@ -1638,14 +2104,43 @@ def handle_gesture_control():
     except Exception as e:
         return f"Error activating gesture control: {e}"
 
+@functools.lru_cache(maxsize=4)
+def _genai_client(api_key: str):
+    """Return a Gemini client for `api_key`, reusing its connection across turns."""
+    return genai.Client(api_key=api_key)
+
+@functools.lru_cache(maxsize=1)
+def _ollama_client():
+    """Return a shared ollama client so local turns reuse one keep-alive connection."""
+    return ollama.Client()
+
+# Conversation roles forwarded to Gemini, mapped to the SDK's role names
+_GEMINI_ROLES = {"user": "user", "assistant": "model"}
+
+# Content objects already built for earlier turns, keyed by the raw message
+# (role, text, is-tool-result). The history is resent every turn, so only new
+# messages get wrapped; keying on the history's own strings keeps the lookup to
+# a cached-hash check instead of formatting and hashing a new string per turn.
+_GEMINI_CONTENT_CACHE: Dict[Tuple[str, str, bool], Any] = {}
+_GEMINI_CONTENT_CACHE_SIZE = 256
+
+def _gemini_content(role: str, text: str, tool_result: bool = False):
+    """Return a (cached) Gemini Content object for one message."""
+    key = (role, text, tool_result)
+    content = _GEMINI_CONTENT_CACHE.get(key)
+    if content is None:
+        if tool_result:
+            text = f"TOOL EXECUTION RESULT:\n{text}"
+        content = genai_types.Content(role=role, parts=[genai_types.Part(text=text)])
+        if len(_GEMINI_CONTENT_CACHE) >= _GEMINI_CONTENT_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _GEMINI_CONTENT_CACHE.pop(next(iter(_GEMINI_CONTENT_CACHE)), None)
+        _GEMINI_CONTENT_CACHE[key] = content
+    return content
+
 def get_response(conversation_messages, model_name='ministral-3:8b', online=False,
                  gemini_api_key=None, gemini_model="gemini-2.5-flash"):
-    import google.genai as genai
-    from google.genai import types
-    import google.api_core.exceptions
-    import httpx
-    import socket
-
+    """Return the model's reply to a conversation (Gemini online, ollama offline)."""
     # Validate input
     if not isinstance(conversation_messages, list):
         return "Invalid message format. Expected list of messages."
@@ -1661,29 +2156,27 @@ def get_response(conversation_messages, model_name='ministral-3:8b', online=Fals
                 gemini_api_key = os.getenv("GEMINI_API_KEY")
             if not gemini_api_key:
                 return "Gemini API key not found. Please set GEMINI_API_KEY in environment."
-            client = genai.Client(api_key=gemini_api_key)
+            if genai is None:
+                return "google-genai is not installed. Please install it to use online mode."
+            client = _genai_client(gemini_api_key)
 
-            # Build system_instruction and contents (same as before)
+            # Build system_instruction and contents in a single pass: the first
+            # system message is the instruction, later ones are tool results
             initial_system_prompt = None
-            for msg in conversation_messages:
-                if msg['role'] == 'system':
-                    initial_system_prompt = msg['content']
-                    break
-            
             gemini_contents = []
             for msg in conversation_messages:
-                if msg['role'] == 'system' and msg['content'] == initial_system_prompt:
-                    continue
-                if msg['role'] == 'system':
-                    gemini_contents.append(
-                        types.Content(role="user", parts=[types.Part(text=f"TOOL EXECUTION RESULT:\n{msg['content']}")])
-                    )
-                
-                elif msg['role'] == 'user':
-                    gemini_contents.append(types.Content(role="user", parts=[types.Part(text=msg['content'])]))
-                elif msg['role'] == 'assistant':
-                    gemini_contents.append(types.Content(role="model", parts=[types.Part(text=msg['content'])]))
-            config = types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=-1))
+                role = msg['role']
+                content = msg['content']
+                if role == 'system':
+                    if initial_system_prompt is None:
+                        initial_system_prompt = content
+                        continue
+                    if content == initial_system_prompt:
+                        continue
+                    gemini_contents.append(_gemini_content("user", content, tool_result=True))
+                elif role in _GEMINI_ROLES:
+                    gemini_contents.append(_gemini_content(_GEMINI_ROLES[role], content))
+            config = genai_types.GenerateContentConfig(thinking_config=genai_types.ThinkingConfig(thinking_budget=-1))
 
             if initial_system_prompt:
                 config.system_instruction = initial_system_prompt
@@ -1693,13 +2186,18 @@ def get_response(conversation_messages, model_name='ministral-3:8b', online=Fals
             base_delay = 1
             for attempt in range(max_retries):
                 try:
-                    response = client.models.generate_content(
+                    stream = client.models.generate_content_stream(
                         model=gemini_model,
                         contents=gemini_contents,
                         config=config,
                     )
+                    reply_parts = []
+                    for chunk in stream:
+                        text = chunk.text
+                        if text:
+                            reply_parts.append(text)
 
-                    model_reply = response.text or ""
+                    model_reply = "".join(reply_parts)
                     if not model_reply.strip():
                         print(f"Warning: Empty response from model (attempt {attempt + 1})")
                         if attempt < max_retries - 1:
@@ -1709,7 +2207,7 @@ def get_response(conversation_messages, model_name='ministral-3:8b', online=Fals
                         return "I apologize, but I couldn't generate a response. Please try rephrasing your request."
                     break
 
-                except google.api_core.exceptions.ServiceUnavailable as e:
+                except _ServiceUnavailable as e:
                     if attempt < max_retries - 1:
                         delay = base_delay * (2 ** attempt)
                         print(f"503 error, retrying in {delay}s... ({attempt + 1}/{max_retries})")
@@ -1717,7 +2215,7 @@ def get_response(conversation_messages, model_name='ministral-3:8b', online=Fals
                         continue
                     raise
 
-                except (httpx.ConnectError, httpx.NetworkError, socket.gaierror) as net_err:
+                except _NETWORK_ERRORS as net_err:
                     # Network-level failure; log and fall back to offline model
                     print(f"Network error while calling Gemini API: {net_err}; falling back to offline model.")
                     online = False
@@ -1731,15 +2229,21 @@ def get_response(conversation_messages, model_name='ministral-3:8b', online=Fals
 
             # Offline path; use ollama local model
             try:
-                import ollama
-                response = ollama.chat(model=model_name, messages=conversation_messages)
-                model_reply = response.get('message', {}).get('content', '')
+                if ollama is None:
+                    raise ImportError("ollama is not installed")
+                stream = _ollama_client().chat(model=model_name, messages=conversation_messages, stream=True)
+                reply_parts = []
+                for chunk in stream:
+                    text = chunk['message']['content']
+                    if text:
+                        reply_parts.append(text)
+                model_reply = "".join(reply_parts)
             except Exception as e:
                 print(f"Offline model error: {e}")
                 return "Offline model is unavailable. Please check your local model (ollama) or network settings."
         
         return model_reply.strip()
-    except google.api_core.exceptions.ServiceUnavailable:
+    except _ServiceUnavailable:
         print("All retries failed due to model overload.")
         return "The AI service is currently overloaded. Please try again later."
     except Exception as e:
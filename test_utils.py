@@ -0,0 +1,71 @@
+"""Focused tests for pure helpers in modules.utils (no network or devices)."""
+
+from modules.utils import ToolExecutionPipeline, _news_snippet
+
+
+def test_news_snippet_drops_tag_between_words_without_space():
+    assert _news_snippet("a<b>c") == "ac"
+
+
+def test_news_snippet_keeps_one_space_around_dropped_tag():
+    assert _news_snippet("foo <b>bar") == "foo bar"
+
+
+def test_news_snippet_removes_escaped_tags():
+    # Descriptions are unescaped before cleaning, so &lt;b&gt; is a real tag
+    assert _news_snippet("&lt;b&gt;Bold&lt;/b&gt; news") == "Bold news"
+
+
+def test_news_snippet_keeps_unescaped_text():
+    assert _news_snippet("Tom &amp; Jerry") == "Tom & Jerry"
+
+
+def test_news_snippet_removes_urls():
+    assert _news_snippet("see http://example.com/a now") == "see now"
+
+
+def test_news_snippet_collapses_whitespace():
+    assert _news_snippet("  lots   of\n\n space ") == "lots of space"
+
+
+def test_news_snippet_google_news_markup():
+    description = '<a href="http://x">Title</a>&nbsp;<font color="#6f6f6f">Dawn</font>'
+    assert _news_snippet(description) == "Title Dawn"
+
+
+def test_news_snippet_truncates_after_cleaning():
+    # Long only because of markup: the cleaned text fits, so no truncation
+    assert _news_snippet("<i>" + "y" * 590 + "</i>" + "<br>" * 100) == "y" * 590
+
+
+def test_news_snippet_truncates_long_text():
+    assert _news_snippet("z" * 700) == "z" * 500 + "..."
+
+
+def _extract(text):
+    return ToolExecutionPipeline().extract_tool_calls(text)
+
+
+def test_extract_tool_calls_multiple_blocks():
+    text = "First ```tool_code\nget_weather('Lahore')\n``` then ```tool_code\nget_current_time()\n```"
+    assert _extract(text) == ["get_weather('Lahore')", "get_current_time()"]
+
+
+def test_extract_tool_calls_skips_empty_block():
+    text = "```tool_code\n```\n```tool_code\nget_current_date()\n```"
+    assert _extract(text) == ["get_current_date()"]
+
+
+def test_extract_tool_calls_ignores_unclosed_block():
+    assert _extract("```tool_code\nget_news()") == []
+    text = "```tool_code\nget_news()\n``` and ```tool_code\nget_weather('Karachi')"
+    assert _extract(text) == ["get_news()"]
+
+
+def test_extract_tool_calls_ignores_following_plain_fence():
+    text = "```tool_code\nget_news()\n```\nExample:\n```\nprint('hi')\n```"
+    assert _extract(text) == ["get_news()"]
+
+
+def test_extract_tool_calls_opening_fence_is_case_sensitive():
+    assert _extract("```TOOL_CODE\nget_news()\n```") == []